@@ -1,5 +1,4 @@
 import os
-import shutil
 from .abstract_command import AbstractCommand
 from ..services.console_logger import ColorPrint
 from ..services.state_utils import StateUtils
@@ -28,8 +27,7 @@ class Init(AbstractCommand):
         if StateHolder.repository is not None:
             target_file = os.path.join(ProjectUtils.get_target_dir(StateHolder.catalog_element),
                                        StateHolder.catalog_element.get('file', 'poco.yml'))
-            if not os.path.exists(target_file):
-                Init.fix_file(target_file)
+            Init.fix_file(target_file)
         else:
             file = FileUtils.get_backward_compatible_poco_file(directory=os.getcwd())
             if file is None:
@@ -39,10 +37,6 @@ class Init(AbstractCommand):
 
     @staticmethod
     def fix_file(target_file):
-        if not os.path.exists(target_file):
-            src_file = os.path.join(os.path.dirname(__file__), '../services/resources/poco.yml')
-            shutil.copyfile(src=src_file, dst=target_file)
-            default_compose = os.path.join(os.path.dirname(target_file), 'docker-compose.yml')
-            if not os.path.exists(default_compose):
-                src_file = os.path.join(os.path.dirname(__file__), '../services/resources/docker-compose.yml')
-                shutil.copyfile(src=src_file, dst=default_compose)
+        if FileUtils.copy_template(template=FileUtils.POCO_TEMPLATE, target_file=target_file):
+            FileUtils.copy_template(template=FileUtils.COMPOSE_TEMPLATE,
+                                    target_file=os.path.join(os.path.dirname(target_file), 'docker-compose.yml'))
@@ -3,7 +3,6 @@ from ..services.state import StateHolder
 from ..services.environment_utils import EnvironmentUtils
 from ..services.console_logger import ColorPrint
 from ..services.project_utils import ProjectUtils
-from ..services.command_handler import CommandHandler
 
 
 class Install(Start):
@@ -20,5 +19,6 @@ class Install(Start):
     def execute(self):
         #  Run init script, if exists
         if StateHolder.compose_handler.have_script("init_script"):
+            from ..services.command_handler import CommandHandler
             CommandHandler().run_script("init_script")
         ColorPrint.print_info("Install completed to " + ProjectUtils.get_target_dir(StateHolder.catalog_element))
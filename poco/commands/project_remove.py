@@ -1,5 +1,4 @@
 from .checkout import Checkout
-from ..services.command_handler import CommandHandler
 from ..services.console_logger import ColorPrint
 from ..services.catalog_handler import CatalogHandler
 from ..services.state import StateHolder
@@ -39,6 +38,7 @@ class ProjectRemove(Checkout):
     def run(catalog, lst, dry_run):
         if not dry_run:
             if StateHolder.poco_file is not None and StateHolder.compose_handler.have_script("remove_script"):
+                from ..services.command_handler import CommandHandler
                 CommandHandler().run_script("remove_script")
             lst.pop(StateHolder.name)
             CatalogHandler.write_catalog(catalog=catalog)
@@ -2,7 +2,6 @@ import os
 from .abstract_command import AbstractCommand
 from ..services.state_utils import StateUtils
 from ..services.state import StateHolder
-from ..services.command_handler import CommandHandler
 from ..services.console_logger import ColorPrint
 
 
@@ -28,6 +27,7 @@ class Start(AbstractCommand):
         self.check_poco_file()
 
     def execute(self):
+        from ..services.command_handler import CommandHandler
         if self.need_checkout:
             StateHolder.compose_handler.run_checkouts()
         CommandHandler().run(self.run_command)
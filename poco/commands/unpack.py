@@ -1,7 +1,6 @@
 from .start import Start
 from ..services.state_utils import StateUtils
 from ..services.state import StateHolder
-from ..services.package_handler import PackageHandler
 from ..services.file_utils import FileUtils
 
 
@@ -18,4 +17,5 @@ class Unpack(Start):
         StateUtils.prepare("compose_handler")
 
     def execute(self):
+        from ..services.package_handler import PackageHandler
         PackageHandler().unpack()
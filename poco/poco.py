@@ -21,11 +21,11 @@ import pkgutil
 import traceback
 import os
 import sys
-from docopt import docopt
 from .commands.abstract_command import AbstractCommand, CommandState
 from .services.cta_utils import CTAUtils
 from .services.environment_utils import EnvironmentUtils
 from .services.console_logger import ColorPrint
+from .services.docopt_utils import DocoptUtils
 from .services.state import StateHolder
 
 
@@ -36,15 +36,20 @@ __version__ = '0.98.1'
 class Poco(object):
 
     command_classes = dict()
+    command_map = dict()  # (sub command, command) -> command class
+    command_docs = dict()  # command class -> usage doc
     active_object = None
 
-    def __init__(self, home_dir=os.path.join(os.path.expanduser(path='~'), '.poco'),
+    def __init__(self, home_dir=os.path.join(StateHolder.user_home, '.poco'),
                  argv=sys.argv[1:]):
         EnvironmentUtils.check_version(__version__)
         EnvironmentUtils.set_poco_uid_and_gid()
 
         StateHolder.home_dir = home_dir
+        StateHolder.directory_name = None
+        StateHolder.project_repositories = dict()
         self.argv = argv
+        self.full_doc = None
         self.collect_commands()
 
     def start_flow(self):
@@ -92,13 +97,18 @@ class Poco(object):
     def check_command(self):
         if len(self.argv) == 0:
             self.argv.append('-h')
-        StateHolder.args = docopt(self.get_full_doc(), version=__version__, options_first=True, argv=self.argv)
-        StateHolder.args.update(self.command_interpreter(command=StateHolder.args['<command>'],
-                                                         argv=[] + StateHolder.args['<args>']))
+        args = DocoptUtils.docopt(self.get_full_doc(), version=__version__, options_first=True, argv=self.argv)
+        args.update(self.command_interpreter(command=args['<command>'], argv=[] + args['<args>']))
+        StateHolder.set_args(args)
         ColorPrint.set_log_level(StateHolder.args)
         ColorPrint.print_info('arguments:\n' + str(StateHolder.args), 1)
 
     def get_full_doc(self):
+        if self.full_doc is None:
+            self.full_doc = self.build_full_doc()
+        return self.full_doc
+
+    def build_full_doc(self):
         doc = __doc__
         commands = []
         for sub_cmd in self.command_classes.keys():
@@ -114,20 +124,20 @@ class Poco(object):
         if command == 'help':
             argv.append('-h')
             if len(argv) == 1:
-                docopt(self.get_full_doc() + "\n" + CTAUtils.get_cta(), argv=argv)
-            self.command_interpreter(argv[0], argv[1:])
-        if command in self.command_classes.keys():
+                DocoptUtils.docopt(self.get_full_doc() + "\n" + CTAUtils.get_cta(), argv=argv)
+            return self.command_interpreter(argv[0], argv[1:])
+        if command in self.command_classes:
             if len(argv) == 0:
                 argv.append("-h")
-            args = self.get_args(command=command, classes=self.command_classes[command], argv=argv)
+            args = self.get_args(command=command, argv=argv)
             if args is None:
-                docopt(self.build_sub_commands_help(command, classes=self.command_classes[command]),
-                       argv=[command] + argv)
+                DocoptUtils.docopt(self.build_sub_commands_help(command, classes=self.command_classes[command]),
+                                   argv=[command] + argv)
         else:
-            args = self.get_args(command=None, classes=self.command_classes[None], argv=[command] + argv)
+            args = self.get_args(command=None, argv=[command] + argv)
             if args is None:
                 argv.append('-h')
-                docopt(self.get_full_doc() + "\n\n" + "%r is not a poco command." % command, argv=argv)
+                DocoptUtils.docopt(self.get_full_doc() + "\n\n" + "%r is not a poco command." % command, argv=argv)
         return args
 
     @staticmethod
@@ -148,14 +158,18 @@ class Poco(object):
         cmd += (40 - len(cmd)) * " "
         commands.append("  " + cmd + description + "\n")
 
-    def get_args(self, command, classes, argv):
-        for cls in classes:
-            cmd = getattr(cls, 'command')
-            if not isinstance(cmd, list):
-                cmd = [cmd]
-            if argv[0] in cmd:
-                self.active_object = cls()
-                return docopt(Poco.build_command_help(cls), argv=[command] + argv if command is not None else argv)
+    def get_args(self, command, argv):
+        cls = self.command_map.get((command, argv[0]))
+        if cls is not None:
+            self.active_object = cls()
+            return DocoptUtils.docopt(Poco.get_command_help(cls),
+                                      argv=[command] + argv if command is not None else argv)
+
+    @staticmethod
+    def get_command_help(cls):
+        if cls not in Poco.command_docs:
+            Poco.command_docs[cls] = Poco.build_command_help(cls)
+        return Poco.command_docs[cls]
 
     @staticmethod
     def build_command_help(cls):
@@ -208,9 +222,12 @@ class Poco(object):
         for base_class in inspect.getmro(cls)[1:]:
             if base_class == AbstractCommand:
                 sub_command = getattr(cls, 'sub_command')
-                if sub_command not in self.command_classes.keys():
+                if sub_command not in self.command_classes:
                     self.command_classes[sub_command] = list()
                 self.command_classes[sub_command].append(cls)
+                cmd = getattr(cls, 'command')
+                for name in cmd if isinstance(cmd, list) else [cmd]:
+                    self.command_map.setdefault((sub_command, name), cls)
                 break
 
 
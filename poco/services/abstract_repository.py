@@ -1,7 +1,7 @@
 import os
 import sys
-import platform
 from .console_logger import ColorPrint
+from .environment_utils import EnvironmentUtils
 from .file_utils import FileUtils
 from .yaml_utils import YamlUtils
 from subprocess import Popen, PIPE
@@ -66,14 +66,11 @@ class AbstractRepository(object):
     def check_remote(url):
         # TODO need a better solution
         o = urlparse.urlparse(url)
-        host = o.netloc
-        while "@" in host:
-            host = host[host.find("@")+1:]
-        while ":" in host:
-            host = host[:host.find(":")]
+        host = o.netloc.rpartition("@")[2]  # drop user info
+        host = host.partition(":")[0]  # drop port
         cmd = list()
         cmd.append("ping")
-        if platform.system().lower().startswith("win"):
+        if EnvironmentUtils.HOST_SYSTEM.lower().startswith("win"):
             cmd.append("-n")
             cmd.append("1")
             cmd.append("-w")
@@ -87,3 +84,32 @@ class AbstractRepository(object):
         out, err = p.communicate()
 
         return len(err) == 0
+
+    @staticmethod
+    def is_same_host(old_url, url):
+        return AbstractRepository.clean_url(str(old_url)) == AbstractRepository.clean_url(str(url))
+
+    @staticmethod
+    def clean_url(url):
+        # remove leading protocol
+        url = url.lstrip("https://")
+        url = url.lstrip("ssh://")
+
+        # remove user info
+        idx = url.find("@")
+        if not idx == -1:
+            url = url[idx+1:]
+
+        # remove port
+        idx = url.find(":")
+        if not idx == -1:
+            idx2 = url.find("/", idx)
+            if not idx2 == -1:
+                url = url[:idx] + url[idx2:]
+
+        # remove scm part ( Atlassian stash compatibility )
+        idx = url.find("/scm")
+        if not idx == -1:
+            url = url[:idx] + url[idx+4:]
+
+        return url
@@ -29,7 +29,7 @@ class BitbucketRepository(AbstractRepository):
             self.prepare_dict_bitbucket_own()
 
         self.write_yaml_file(os.path.join(self.target_dir, 'poco-catalog.yml'),
-                             yaml.dump(data=self.lst, default_flow_style=False), create=True)
+                             yaml.safe_dump(data=self.lst, default_flow_style=False), create=True)
 
     def prepare_dict_bitbucket_online(self):
         pass
@@ -2,11 +2,6 @@ import os
 import yaml
 from .console_logger import *
 from .file_repository import FileRepository
-from .git_repository import GitRepository
-from .github_repository import GitHubRepository
-from .gitlab_repository import GitLabRepository
-from .bitbucket_repository import BitbucketRepository
-from .svn_repository import SvnRepository
 from .environment_utils import EnvironmentUtils
 from .state import StateHolder
 
@@ -54,7 +49,7 @@ class CatalogHandler:
     def write_catalog(catalog):
         """Write catalog file"""
         if catalog is not None and catalog in StateHolder.catalogs:
-            string_format = yaml.dump(data=StateHolder.catalogs[catalog], default_flow_style=False)
+            string_format = yaml.safe_dump(data=StateHolder.catalogs[catalog], default_flow_style=False)
             StateHolder.catalog_repositories[catalog].repository.write_yaml_file(CatalogHandler.get_catalog_file(
                 StateHolder.catalog_repositories[catalog].config), string_format)
 
@@ -111,23 +106,29 @@ class CatalogHandler:
     @staticmethod
     def get_repo(key, repo, silent):
         conf = StateHolder.config[key]
+        # repository backends are imported only when needed, their libraries are slow to load
         if 'git' == repo:
+            from .git_repository import GitRepository
             repository = GitRepository(target_dir=os.path.join(StateHolder.home_dir, 'catalogHome', key),
                                        url=CatalogHandler.get_url(conf),
                                        branch=CatalogHandler.get_branch(conf),
                                        git_ssh_identity_file=conf.get("ssh-key"), silent=silent)
         elif 'svn' == repo:
+            from .svn_repository import SvnRepository
             repository = SvnRepository(target_dir=os.path.join(StateHolder.home_dir, 'catalogHome', key),
                                        url=CatalogHandler.get_url(conf))
         elif 'gitHub' == repo:
+            from .github_repository import GitHubRepository
             repository = GitHubRepository(name=key,
                                           token=conf.get("token"), user=conf.get("user"), passw=conf.get("pass"),
                                           url=CatalogHandler.get_url(conf))
         elif 'gitLab' == repo:
+            from .gitlab_repository import GitLabRepository
             repository = GitLabRepository(name=key,
                                           token=conf.get("token"), url=CatalogHandler.get_url(conf),
                                           ssh=conf.get("ssh"))
         elif 'bitbucket' == repo:
+            from .bitbucket_repository import BitbucketRepository
             repository = BitbucketRepository(name=key, user=conf.get("user"), passw=conf.get("pass"),
                                              url=CatalogHandler.get_url(conf), ssh=conf.get("ssh"))
         else:
@@ -1,10 +1,11 @@
+import hashlib
 import os
-import platform
+import pickle
+from collections import OrderedDict
 from .console_logger import ColorPrint, Doc
 from .file_utils import FileUtils
 from .project_utils import ProjectUtils
 from .environment_utils import EnvironmentUtils
-from .package_handler import PackageHandler
 from .state import StateHolder
 from .command_runners import ScriptPlanRunner, DockerPlanRunner, KubernetesRunner, HelmRunner
 from .yaml_utils import YamlUtils
@@ -12,6 +13,15 @@ from .yaml_utils import YamlUtils
 
 class CommandHandler(object):
 
+    HIERARCHY_FILE = os.path.join(FileUtils.RESOURCES_DIR, 'command-hierarchy.yml')
+    HIERARCHY_PICKLE = os.path.join(FileUtils.RESOURCES_DIR, 'command-hierarchy.pkl')  # created by setup.py build
+    hierarchy_cache = None  # bundled resource, parsed only once, must not be modified
+    ENV_CACHE_SIZE = 100
+    env_cache = OrderedDict()  # environment file -> (mtime, size, variables), least recently used first
+    ENVIRONMENT_CHECKS = {"Docker": "check_docker", "Kubernetes": "check_kubernetes", "Helm": "check_helm"}
+    CLUSTER_RUNNERS = {"Kubernetes": KubernetesRunner, "Helm": HelmRunner}
+    HOOK_METHODS = ('pack',)  # methods usable as premethods and postmethods in the hierarchy
+
     def __init__(self):
 
         self.hierarchy = self.load_hierarchy()
@@ -19,78 +29,95 @@ class CommandHandler(object):
         self.project_compose = StateHolder.compose_handler.compose_project
         self.working_directory = StateHolder.compose_handler.get_working_directory()
         self.plan = StateHolder.compose_handler.plan
+        self.plan_config = self.project_compose['plan'][self.plan]
+        self.plan_options = ProjectUtils.get_plan_options(self.plan_config)
+        self.compose_dir_files = dict()  # docker-compose-dir directories -> (env files, compose files)
         self.repo_dir = StateHolder.repository.target_dir if StateHolder.repository is not None else os.getcwd()
 
         ''' Check mode '''
-        plan = self.project_compose['plan'][self.plan]
-        if isinstance(plan, dict) and ('kubernetes-file' in plan or 'kubernetes-dir' in plan):
+        options = self.plan_options
+        if 'kubernetes-file' in options or 'kubernetes-dir' in options:
             StateHolder.container_mode = "Kubernetes"
-        elif isinstance(plan, dict) and ('helm-file' in plan or 'helm-dir' in plan):
+        elif 'helm-file' in options or 'helm-dir' in options:
             StateHolder.container_mode = "Helm"
         self.script_runner = ScriptPlanRunner(project_compose=self.project_compose,
                                               working_directory=self.working_directory)
+        self.hook_methods = dict((name, getattr(self, name)) for name in CommandHandler.HOOK_METHODS)
 
-        if StateHolder.container_mode == "Docker":
-            EnvironmentUtils.check_docker()
-        elif StateHolder.container_mode == "Kubernetes":
-            EnvironmentUtils.check_kubernetes()
-        elif StateHolder.container_mode == "Helm":
-            EnvironmentUtils.check_helm()
+        check = CommandHandler.ENVIRONMENT_CHECKS.get(StateHolder.container_mode)
+        if check is not None:
+            getattr(EnvironmentUtils, check)()  # looked up by name, so the checks stay patchable
 
     @staticmethod
     def load_hierarchy():
-        return YamlUtils.read(os.path.join(os.path.dirname(__file__), 'resources/command-hierarchy.yml'),
-                              doc=Doc.POCO)
+        if CommandHandler.hierarchy_cache is None:
+            hierarchy = CommandHandler.load_precompiled_hierarchy()
+            if hierarchy is None:
+                hierarchy = YamlUtils.read(CommandHandler.HIERARCHY_FILE, doc=Doc.POCO)
+            if not isinstance(hierarchy, dict):
+                ColorPrint.exit_after_print_messages("Command hierarchy config is missing")
+            CommandHandler.hierarchy_cache = hierarchy
+        return CommandHandler.hierarchy_cache
+
+    @staticmethod
+    def load_precompiled_hierarchy():
+        """Load the hierarchy pickled at install time, if it is built from the actual YAML"""
+        try:
+            with open(CommandHandler.HIERARCHY_FILE, 'rb') as stream:
+                digest = hashlib.sha1(stream.read()).hexdigest()
+            with open(CommandHandler.HIERARCHY_PICKLE, 'rb') as stream:
+                precompiled = pickle.load(stream)
+            if not isinstance(precompiled, dict) or precompiled.get('digest') != digest:
+                return None
+            return precompiled.get('hierarchy')
+        except (IOError, OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return None
 
     def run_script(self, script):
-        self.script_runner.run(plan=self.project_compose['plan'][self.plan], script_type=script)
+        self.script_runner.run(plan=self.plan_config, script_type=script)
 
     def run(self, cmd):
         self.check_command(cmd)
-        plan = self.project_compose['plan'][self.plan]
+        plan = self.plan_config
         command_list = self.hierarchy[cmd]
 
         if not isinstance(command_list, dict):
             ColorPrint.print_info("Wrong command in hierarchy: " + str(command_list))
 
         self.pre_run(command_list, plan)
-        if isinstance(plan, dict) and 'script' in plan:
+        if 'script' in self.plan_options:
             # script running only if start or up command
             if cmd == 'start' or cmd == 'up':
                 self.script_runner.run(plan=plan, script_type='script')
-        elif StateHolder.container_mode in ['Kubernetes', 'Helm']:
+        elif StateHolder.container_mode in CommandHandler.CLUSTER_RUNNERS:
             self.run_kubernetes(cmd, command_list, plan)
         else:
             self.run_docker(cmd, command_list, plan)
         self.after_run(command_list, plan)
 
     def run_docker(self, cmd, command_list, plan):
-        runner = DockerPlanRunner(project_compose=self.project_compose,
-                                  working_directory=self.working_directory,
-                                  repo_dir=self.repo_dir)
+        runner = self.get_docker_runner(plan=plan)
+        envs = self.get_environment_variables(plan=plan)
         # Pull before start in developer mode
         if StateHolder.always_update and cmd in ('start', 'up', 'restart') and not StateHolder.offline:
-            runner.run(plan=plan, commands='pull', envs=self.get_environment_variables(plan=plan))
+            runner.run(plan=plan, commands='pull', envs=envs)
         for cmd in command_list['docker']:
             if isinstance(cmd, list) and 'pull' in cmd and StateHolder.offline:  # Skip pull in offline mode
                 continue
-            runner.run(plan=plan, commands=cmd,
-                       envs=self.get_environment_variables(plan=plan))
+            runner.run(plan=plan, commands=cmd, envs=envs)
 
     def run_kubernetes(self, cmd, command_list, plan):
-        runner = KubernetesRunner(working_directory=self.working_directory, repo_dir=self.repo_dir) \
-            if StateHolder.container_mode == 'Kubernetes' \
-            else HelmRunner(working_directory=self.working_directory, repo_dir=self.repo_dir)
+        runner = CommandHandler.CLUSTER_RUNNERS[StateHolder.container_mode](working_directory=self.working_directory,
+                                                                           repo_dir=self.repo_dir)
 
-        if len(command_list[StateHolder.container_mode.lower()]) == 0:
+        commands = command_list[StateHolder.container_mode.lower()]
+        if len(commands) == 0:
             ColorPrint.exit_after_print_messages('Command: ' + cmd + ' not supported with' + StateHolder.container_mode)
-        for cmd in command_list[StateHolder.container_mode.lower()]:
-            runner.run(plan=plan, commands=cmd, envs=self.get_environment_variables(plan=plan))
+        envs = self.get_environment_variables(plan=plan)
+        for cmd in commands:
+            runner.run(plan=plan, commands=cmd, envs=envs)
 
     def check_command(self, cmd):
-        if self.hierarchy is None or not isinstance(self.hierarchy, dict):
-            ColorPrint.exit_after_print_messages("Command hierarchy config is missing")
-
         if cmd not in self.hierarchy:
             ColorPrint.exit_after_print_messages("Command not found in hierarchy: " + str(cmd))
 
@@ -105,9 +132,10 @@ class CommandHandler(object):
             self.script_runner.run(plan=plan, script_type='after_script')
 
     def run_method(self, type, command_list):
-        if type in command_list and len(command_list[type]) > 0:
-            for method in command_list[type]:
-                getattr(self, method)()
+        for method in command_list.get(type, ()):
+            if method not in self.hook_methods:
+                ColorPrint.exit_after_print_messages("Unknown method in hierarchy: " + str(method))
+            self.hook_methods[method]()
 
     def parse_environment_dict(self, path, env):
         """Compose dictionary from environment variables."""
@@ -118,22 +146,36 @@ class CommandHandler(object):
         if env_file is None:
             ColorPrint.exit_after_print_messages(
                 message="Environment file (" + str(file_name) + ") not exists in repository: " + StateHolder.name)
+        env.update(CommandHandler.read_environment_file(env_file))
+
+    @staticmethod
+    def read_environment_file(env_file):
+        """Get variables of the environment file, parse it only if it is changed since the last read"""
+        stat = os.stat(env_file)
+        cached = CommandHandler.env_cache.pop(env_file, None)
+        if cached is None or cached[0] != stat.st_mtime or cached[1] != stat.st_size:
+            cached = (stat.st_mtime, stat.st_size, CommandHandler.parse_environment_file(env_file))
+        CommandHandler.env_cache[env_file] = cached
+        if len(CommandHandler.env_cache) > CommandHandler.ENV_CACHE_SIZE:
+            CommandHandler.env_cache.popitem(last=False)
+        return cached[2]
+
+    @staticmethod
+    def parse_environment_file(env_file):
+        variables = dict()
         with open(env_file) as stream:
-            lineno = 0
-            for line in stream.readlines():
-                lineno += 1
-                if not line.strip() or line.startswith("#"):
+            for lineno, line in enumerate(stream, 1):
+                if line[:1] == "#" or not line.strip():  # comments are checked first, they are the common case
+                    continue
+                key, separator, value = line.partition("=")
+                key = key.strip()
+                if separator and key:
+                    variables[key] = value.partition("#")[0].strip()
                     continue
-                data = line.split("=", 1)
-                if len(data) == 2:
-                    key = data[0].strip()
-                    value = data[1].split("#")[0].strip()
-                    if key and value is not None:
-                        env[key] = value
-                        continue
                 ColorPrint.exit_after_print_messages("Environment file (" + str(env_file) +
                                                      ") is malformed, error at line " + str(lineno) +
                                                      ", value: " + line)
+        return variables
 
     def get_environment_dict(self, envs):
         """Process environment files. Environment for selected plan will be override the defaults"""
@@ -153,29 +195,41 @@ class CommandHandler(object):
     def get_environment_variables(self, plan):
         """Get all environment variables depends on selected plan"""
         envs = list()
-        if isinstance(plan, dict):
-            if 'environment' in plan and 'include' in plan['environment']:
-                envs.extend(ProjectUtils.get_list_value(plan['environment']['include']))
-            if 'docker-compose-dir' in plan:
-                envs.extend(FileUtils.get_filtered_sorted_alter_from_base_dir(base_dir=self.repo_dir,
-                                                                              actual_dir=self.working_directory,
-                                                                              target_directories=ProjectUtils.
-                                                                              get_list_value(
-                                                                                  plan['docker-compose-dir']),
-                                                                              filter_ends='.env'))
+        options = ProjectUtils.get_plan_options(plan)
+        if 'environment' in options and 'include' in options['environment']:
+            envs.extend(ProjectUtils.get_list_value(options['environment']['include']))
+        if 'docker-compose-dir' in options:
+            envs.extend(self.get_compose_dir_files(directories=options['docker-compose-dir'])[0])
         env_dict = self.get_environment_dict(envs=envs)
         env_copy = os.environ.copy()
-        for key in env_dict.keys():
-            env_copy[key] = env_dict[key]
+        env_copy.update(env_dict)
 
         """Add host system to environment"""
-        env_copy["HOST_SYSTEM"] = platform.system()
+        env_copy["HOST_SYSTEM"] = EnvironmentUtils.HOST_SYSTEM
         return env_copy
 
+    def get_compose_dir_files(self, directories):
+        """Get the environment and the compose files of docker-compose-dir with walking the directories once"""
+        directories = tuple(ProjectUtils.get_list_value(directories))
+        if directories not in self.compose_dir_files:
+            self.compose_dir_files[directories] = FileUtils.get_filtered_sorted_alter_from_base_dir_multi(
+                base_dir=self.repo_dir, actual_dir=self.working_directory, target_directories=directories,
+                filter_ends_list=[('.env',), ('.yml', '.yaml')])
+        return self.compose_dir_files[directories]
+
+    def get_docker_runner(self, plan):
+        compose_dir_files = dict()
+        options = ProjectUtils.get_plan_options(plan)
+        if 'docker-compose-dir' in options:
+            directories = options['docker-compose-dir']
+            compose_dir_files[tuple(ProjectUtils.get_list_value(directories))] = \
+                self.get_compose_dir_files(directories=directories)[1]
+        return DockerPlanRunner(project_compose=self.project_compose, working_directory=self.working_directory,
+                                repo_dir=self.repo_dir, compose_dir_files=compose_dir_files)
+
     def pack(self):
-        plan = self.project_compose['plan'][self.plan]
+        from .package_handler import PackageHandler
+        plan = self.plan_config
         envs = self.get_environment_variables(plan=plan)
-        runner = DockerPlanRunner(project_compose=self.project_compose,
-                                  working_directory=self.working_directory,
-                                  repo_dir=self.repo_dir)
+        runner = self.get_docker_runner(plan=plan)
         PackageHandler().pack(files=runner.get_docker_files(plan=plan), envs=envs)
@@ -1,5 +1,4 @@
 import os
-import platform
 from subprocess import check_call, CalledProcessError
 from .console_logger import ColorPrint
 from .file_utils import FileUtils
@@ -12,34 +11,30 @@ class AbstractPlanRunner(object):
 
     @staticmethod
     def run_script_with_check(cmd, working_directory, envs):
-        res = check_call(" ".join(cmd), cwd=working_directory, env=envs, shell=True)
+        res = check_call(cmd, cwd=working_directory, env=envs)
         if res > 0:
             ColorPrint.exit_after_print_messages(message=res)
 
     @staticmethod
     def get_file_list(base_dir, working_dir, dir_list):
-        file_list = list()
-        for file in FileUtils.get_filtered_sorted_alter_from_base_dir(base_dir=base_dir,
-                                                                      actual_dir=working_dir,
-                                                                      target_directories=dir_list,
-                                                                      filter_ends=('.yml', '.yaml')):
-            file_list.append(ProjectUtils.get_file(file=file))
-        return file_list
+        return [ProjectUtils.get_file(file=file)
+                for file in FileUtils.get_filtered_sorted_alter_from_base_dir(base_dir=base_dir,
+                                                                              actual_dir=working_dir,
+                                                                              target_directories=dir_list,
+                                                                              filter_ends=('.yml', '.yaml'))]
 
-    @staticmethod
-    def get_file(repo_dir, working_directory, file):
-        return ProjectUtils.get_file(file=FileUtils.get_compose_file_relative_path(
-                                                       repo_dir=repo_dir, working_directory=working_directory,
-                                                       file_name=file))
+    def get_relative_path(self, file_name):
+        """Same as FileUtils.get_compose_file_relative_path, the relative directory is computed once per runner"""
+        return os.path.join(self.relative_dir, file_name)
 
-    @staticmethod
-    def get_files_list(plan, repo_dir, working_directory):
-        files = list()
-        if isinstance(plan, dict) and 'kubernetes-file' in plan:
-            for file in ProjectUtils.get_list_value(plan['kubernetes-file']):
-                files.append(AbstractPlanRunner.get_file(repo_dir=repo_dir, working_directory=working_directory,
-                                                         file=file))
-        return files
+    def get_file(self, file):
+        return ProjectUtils.get_file(file=self.get_relative_path(file_name=file))
+
+    def get_files_list(self, plan):
+        options = ProjectUtils.get_plan_options(plan)
+        if 'kubernetes-file' not in options:
+            return list()
+        return [self.get_file(file=file) for file in ProjectUtils.get_list_value(options['kubernetes-file'])]
 
 
 class ScriptPlanRunner(AbstractPlanRunner):
@@ -76,14 +71,10 @@ class ScriptPlanRunner(AbstractPlanRunner):
         if isinstance(command, list):
             for c in command:
                 ColorPrint.print_with_lvl(" - " + str(c))
-                command_array.append(c)
+            command_array.extend(command)
         else:
             ColorPrint.print_with_lvl(" - " + str(command))
-            command_array.append("/bin/sh")
-            command_array.append("-c")
-            command_array.append("\"")
-            command_array.append(command)
-            command_array.append("\"")
+            command_array.extend(["/bin/sh", "-c", command])
         return command_array
 
     def get_native_scripts(self, plan, script_type):
@@ -97,24 +88,13 @@ class ScriptPlanRunner(AbstractPlanRunner):
         return scripts
 
     def get_script_base(self, base_image, command):
-        command_array = list()
-        command_array.append("docker")
-        command_array.append("run")
-
-        """Add host system to environment"""
-        command_array.append("-e")
-        command_array.append("HOST_SYSTEM="+platform.system())
-        if not platform.system() == 'Windows':
-            command_array.append("-u")
-            command_array.append(EnvironmentUtils.get_variable("POCO_UID", "1000") + ":" + EnvironmentUtils.get_variable("POCO_GID", "1000"))
-        command_array.append("--rm")
-        command_array.append("-v")
-        command_array.append(str(self.working_directory) + ":/usr/local")
-        command_array.append("-w")
-        command_array.append("/usr/local")
-        command_array.append(base_image)
-        for c in command:
-            command_array.append(c)
+        command_array = ["docker", "run", "-e", "HOST_SYSTEM=" + EnvironmentUtils.HOST_SYSTEM]  # add host system
+        if not EnvironmentUtils.HOST_SYSTEM == 'Windows':
+            command_array.extend(["-u", EnvironmentUtils.get_variable("POCO_UID", "1000") + ":" +
+                                  EnvironmentUtils.get_variable("POCO_GID", "1000")])
+        command_array.extend(["--rm", "-v", str(self.working_directory) + ":/usr/local", "-w", "/usr/local",
+                              base_image])
+        command_array.extend(command)
         return command_array
 
 
@@ -123,22 +103,19 @@ class KubernetesRunner(AbstractPlanRunner):
     def __init__(self, working_directory, repo_dir):
         self.working_directory = working_directory
         self.repo_dir = repo_dir
+        self.relative_dir = FileUtils.get_relative_path(repo_dir, working_directory)
 
     def run(self, plan, commands, envs):
-        files = AbstractPlanRunner.get_files_list(plan=plan, repo_dir=self.repo_dir,
-                                                  working_directory=self.working_directory)
-        if isinstance(plan, dict) and len(files) == 0 and 'kubernetes-dir' in plan:
+        options = ProjectUtils.get_plan_options(plan)
+        files = self.get_files_list(plan=options)
+        if len(files) == 0 and 'kubernetes-dir' in options:
             files.extend(self.get_file_list(self.repo_dir, self.working_directory,
-                                            ProjectUtils.get_list_value(plan['kubernetes-dir'])))
+                                            ProjectUtils.get_list_value(options['kubernetes-dir'])))
 
         """Kubernetes commands"""
+        commands = ProjectUtils.get_list_value(commands)
         for kube_file in files:
-            cmd = list()
-            cmd.append("kubectl")
-            cmd.extend(ProjectUtils.get_list_value(commands))
-            cmd.append("-f")
-            cmd.append(str(kube_file))
-
+            cmd = ["kubectl"] + commands + ["-f", str(kube_file)]
             ColorPrint.print_with_lvl(message="Kubernetes command: " + str(cmd), lvl=1)
             self.run_script_with_check(cmd=cmd, working_directory=self.working_directory, envs=envs)
 
@@ -148,24 +125,21 @@ class HelmRunner(AbstractPlanRunner):
     def __init__(self, working_directory, repo_dir):
         self.working_directory = working_directory
         self.repo_dir = repo_dir
+        self.relative_dir = FileUtils.get_relative_path(repo_dir, working_directory)
 
     def run(self, plan, commands, envs):
-        files = AbstractPlanRunner.get_files_list(plan=plan, repo_dir=self.repo_dir,
-                                                  working_directory=self.working_directory)
+        options = ProjectUtils.get_plan_options(plan)
+        files = self.get_files_list(plan=options)
         dirs = list()
-        if isinstance(plan, dict) and 'helm-dir' in plan:
-            directories = ProjectUtils.get_list_value(plan['helm-dir'])
+        if 'helm-dir' in options:
+            directories = ProjectUtils.get_list_value(options['helm-dir'])
             if len(directories) > 1:
                 ColorPrint.print_with_lvl(message="Helm plan use only the first directory from helm-dir")
-            dirs.append(os.path.join(FileUtils.get_relative_path(self.repo_dir, self.working_directory),
-                                     directories[0]))
+            dirs.append(self.get_relative_path(file_name=directories[0]))
 
         """Helm command"""
 
-        cmd = list()
-        cmd.append("helm")
-        cmd.extend(ProjectUtils.get_list_value(commands))
-        cmd.append("poco-" + StateHolder.name)
+        cmd = ["helm"] + ProjectUtils.get_list_value(commands) + ["poco-" + StateHolder.name]
 
         HelmRunner.build_command(cmd=cmd, dirs=dirs, files=files)
         ColorPrint.print_with_lvl(message="Helm command: " + str(cmd), lvl=1)
@@ -180,16 +154,18 @@ class HelmRunner(AbstractPlanRunner):
             if len(dirs) > 0:
                 cmd.append(str(dirs[0]))
             for file in files:
-                cmd.append("-f")
-                cmd.append(str(file))
+                cmd.extend(["-f", str(file)])
 
 
 class DockerPlanRunner(AbstractPlanRunner):
 
-    def __init__(self, project_compose, working_directory, repo_dir):
+    def __init__(self, project_compose, working_directory, repo_dir, compose_dir_files=None):
         self.working_directory = working_directory
         self.project_compose = project_compose
         self.repo_dir = repo_dir
+        # docker-compose-dir directories -> compose files, scanned on first use if not given
+        self.compose_dir_files = dict() if compose_dir_files is None else compose_dir_files
+        self.relative_dir = FileUtils.get_relative_path(repo_dir, working_directory)
 
     def run(self, plan, commands, envs):
 
@@ -197,38 +173,36 @@ class DockerPlanRunner(AbstractPlanRunner):
         docker_files = self.get_docker_files(plan=plan)
 
         """Compose docker command array with project name and compose files"""
-        cmd = list()
-        cmd.append("docker-compose")
-        cmd.append("--project-name")
-        cmd.append(StateHolder.name)
+        cmd = ["docker-compose", "--project-name", StateHolder.name]
         for compose_file in docker_files:
-            cmd.append("-f")
-            cmd.append(str(compose_file))
+            cmd.extend(["-f", str(compose_file)])
         cmd.extend(ProjectUtils.get_list_value(commands))
         ColorPrint.print_with_lvl(message="Docker command: " + str(cmd), lvl=1)
         self.run_script_with_check(cmd=cmd, working_directory=self.working_directory, envs=envs)
 
     def get_docker_files(self, plan):
         docker_files = list()
-        if isinstance(plan, dict) and 'docker-compose-file' in plan:
-            self.parse_file_list(ProjectUtils.get_list_value(plan['docker-compose-file']), docker_files)
-        elif isinstance(plan, dict) and 'docker-compose-dir' in plan:
-            docker_files.extend(self.get_file_list(self.repo_dir, self.working_directory,
-                                                   ProjectUtils.get_list_value(plan['docker-compose-dir'])))
+        options = ProjectUtils.get_plan_options(plan)
+        if 'docker-compose-file' in options:
+            self.parse_file_list(ProjectUtils.get_list_value(options['docker-compose-file']), docker_files)
+        elif 'docker-compose-dir' in options:
+            directories = tuple(ProjectUtils.get_list_value(options['docker-compose-dir']))
+            if directories not in self.compose_dir_files:
+                self.compose_dir_files[directories] = FileUtils.get_filtered_sorted_alter_from_base_dir(
+                    base_dir=self.repo_dir, actual_dir=self.working_directory, target_directories=directories,
+                    filter_ends=('.yml', '.yaml'))
+            docker_files.extend([ProjectUtils.get_file(file=file) for file in self.compose_dir_files[directories]])
         else:
             self.parse_file_list(ProjectUtils.get_list_value(plan), docker_files)
         return docker_files
 
     def parse_file_list(self, services, docker_files):
-        for service in services:
-            docker_files.append(self.get_docker_compose(service=service))
+        docker_files.extend([self.get_docker_compose(service=service) for service in services])
 
     def get_docker_compose(self, service):
         """Get back the docker compose file"""
         file_name = self.get_compose_file_name(service=service)
-        return ProjectUtils.get_file(file=FileUtils.get_compose_file_relative_path(
-                                                       repo_dir=self.repo_dir, working_directory=self.working_directory,
-                                                       file_name=file_name))
+        return self.get_file(file=file_name)
 
     def get_compose_file_name(self, service):
         """Get back docker compose file name"""
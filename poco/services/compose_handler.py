@@ -1,7 +1,7 @@
 import os
 import yaml
+from .abstract_repository import AbstractRepository
 from .console_logger import *
-from .git_repository import GitRepository
 from .project_utils import ProjectUtils
 from .state import StateHolder
 from .yaml_utils import YamlUtils
@@ -13,6 +13,7 @@ class ComposeHandler:
         self.compose_file = compose_file
         self.plan = StateHolder.plan
         self.compose_project = None
+        self.parsed_checkouts = None
 
     def get_working_directory(self):
         """Get back the working directory if it is set or the project file directory"""
@@ -28,56 +29,91 @@ class ComposeHandler:
         """Load compose file from repository"""
         if self.compose_project is not None:
             return
-        with open(self.compose_file) as stream:
-            try:
-                self.compose_project = YamlUtils.ordered_load(stream)
+        try:
+            self.compose_project = YamlUtils.read_ordered(file=self.compose_file, cached=True)
 
-                if 'plan' not in self.compose_project:
-                    ColorPrint.exit_after_print_messages(
-                        message="'plan' section must exists in compose file (poco.yml) ",
-                        doc=Doc.COMPOSE_DOC)
-                if not isinstance(self.compose_project['plan'], dict):
-                    ColorPrint.exit_after_print_messages(
-                        message="'plan' section must be a list", doc=Doc.POCO)
-                if len(self.compose_project['plan'].keys()) < 1:
-                    ColorPrint.exit_after_print_messages(
-                        message="'plan' section must be one child element", doc=Doc.POCO)
-                if self.plan is None:
-                    if "demo" in self.compose_project['plan']:
-                        self.plan = "demo"
-                    elif "default" in self.compose_project['plan']:
-                        self.plan = "default"
-                    else:
-                        self.plan = list(self.compose_project['plan'].keys())[0]
-                if self.plan not in self.compose_project['plan']:
-                    self.get_plan_list()
-                    ColorPrint.exit_after_print_messages(
-                        message="Plan " + str(self.plan) + " does not exist")
+            if 'plan' not in self.compose_project:
+                ColorPrint.exit_after_print_messages(
+                    message="'plan' section must exists in compose file (poco.yml) ",
+                    doc=Doc.COMPOSE_DOC)
+            if not isinstance(self.compose_project['plan'], dict):
+                ColorPrint.exit_after_print_messages(
+                    message="'plan' section must be a list", doc=Doc.POCO)
+            if len(self.compose_project['plan'].keys()) < 1:
+                ColorPrint.exit_after_print_messages(
+                    message="'plan' section must be one child element", doc=Doc.POCO)
+            if self.plan is None:
+                if "demo" in self.compose_project['plan']:
+                    self.plan = "demo"
+                elif "default" in self.compose_project['plan']:
+                    self.plan = "default"
+                else:
+                    self.plan = list(self.compose_project['plan'].keys())[0]
+            if self.plan not in self.compose_project['plan']:
+                self.get_plan_list()
+                ColorPrint.exit_after_print_messages(
+                    message="Plan " + str(self.plan) + " does not exist")
 
-                actual_plan = self.compose_project['plan'].get(self.plan)
-                if actual_plan is None:
-                    ColorPrint.exit_after_print_messages(
-                        message="selected plan %s is empty" % str(self.plan), msg_type="warn", doc=Doc.POCO)
-            except yaml.YAMLError as exc:
-                ColorPrint.exit_after_print_messages(message="Error: Wrong YAML format:\n " + str(exc),
-                                                     doc=Doc.POCO)
+            actual_plan = self.compose_project['plan'].get(self.plan)
+            if actual_plan is None:
+                ColorPrint.exit_after_print_messages(
+                    message="selected plan %s is empty" % str(self.plan), msg_type="warn", doc=Doc.POCO)
+        except yaml.YAMLError as exc:
+            ColorPrint.exit_after_print_messages(message="Error: Wrong YAML format:\n " + str(exc),
+                                                 doc=Doc.POCO)
 
     @staticmethod
     def run_checkouts():
-        for checkout in StateHolder.compose_handler.get_checkouts():
-            args = checkout.split(" ")
-            if not 2 <= len(args) <= 3:
-                ColorPrint.exit_after_print_messages(message="Wrong checkout command: " + checkout
-                                                             + "\nExpected arguments: directory repository [branch]")
-            directory = args[0]
-            repository = args[1]
-            target_dir = os.path.join(StateHolder.compose_handler.get_working_directory(), directory)
-            if not StateHolder.offline:
-                branch = args[2] if len(args) == 3 else "master"
+        compose_handler = StateHolder.compose_handler
+        working_directory = compose_handler.get_working_directory()
+        offline = StateHolder.offline
+        for directory, repository, branch in compose_handler.get_parsed_checkouts():
+            target_dir = os.path.join(working_directory, directory)
+            if not offline and not ComposeHandler.is_kept_checkout(target_dir, repository):
+                from .git_repository import GitRepository
                 GitRepository(target_dir=target_dir, url=repository, branch=branch)
             if not os.path.exists(target_dir):
                 ColorPrint.exit_after_print_messages("checkout directory is empty: " + str(directory))
 
+    @staticmethod
+    def is_kept_checkout(target_dir, url):
+        """Existing clones of the same repository are handled by the user if update is not required"""
+        if StateHolder.always_update or not os.path.isdir(os.path.join(target_dir, '.git')):
+            return False
+        origin_url = ComposeHandler.get_origin_url(target_dir)
+        return origin_url is not None and AbstractRepository.is_same_host(origin_url, url)
+
+    @staticmethod
+    def get_origin_url(target_dir):
+        """Read the origin URL from the git config of the clone without opening the repository"""
+        in_origin = False
+        try:
+            with open(os.path.join(target_dir, '.git', 'config')) as stream:
+                for line in stream:
+                    line = line.strip()
+                    if line.startswith('['):
+                        in_origin = line == '[remote "origin"]'
+                        continue
+                    key, separator, value = line.partition('=')
+                    if in_origin and separator and key.strip() == 'url':
+                        return value.strip()
+        except (IOError, OSError):
+            pass
+        return None
+
+    def get_parsed_checkouts(self):
+        """Get checkouts from compose file as (directory, repository, branch) tuples"""
+        if self.parsed_checkouts is None:
+            self.parsed_checkouts = list()
+            for checkout in self.get_checkouts():
+                args = checkout.split(" ")
+                if not 2 <= len(args) <= 3:
+                    ColorPrint.exit_after_print_messages(
+                        message="Wrong checkout command: " + checkout +
+                                "\nExpected arguments: directory repository [branch]")
+                self.parsed_checkouts.append((args[0], args[1], args[2] if len(args) == 3 else "master"))
+        return self.parsed_checkouts
+
     def get_checkouts(self):
         """Get checkouts list from compose file"""
         self.get_compose_project()
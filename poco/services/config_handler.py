@@ -27,7 +27,7 @@ class ConfigHandler(object):
     def read_catalogs():
         """Parse local configuration file"""
         if not StateHolder.config_parsed:
-            config = YamlUtils.read(file=StateHolder.catalog_config_file, doc=Doc.CATALOGS_CONFIG)
+            config = YamlUtils.read(file=StateHolder.catalog_config_file, doc=Doc.CATALOGS_CONFIG, cached=True)
 
             if not type(config) is dict:
                 config['default'] = {}
@@ -41,7 +41,7 @@ class ConfigHandler(object):
         if not os.path.exists(config_file):
             ColorPrint.print_info("Config file not exists: " + config_file, 1)
             return
-        config = YamlUtils.read(file=config_file, doc=Doc.CONFIG)
+        config = YamlUtils.read(file=config_file, doc=Doc.CONFIG, cached=True)
         if check_wd:
             ConfigHandler.check_wd(config=config)
 
@@ -102,7 +102,7 @@ class ConfigHandler(object):
             conf = StateHolder.config[config]
             if type(conf) is not dict:
                 continue
-            if conf.get("repositoryType", "file") is "file":
+            if conf.get("repositoryType", "file") == "file":
                 FileUtils.make_empty_file_with_empty_dict(directory=StateHolder.home_dir,
                                                           file=conf.get('file', 'poco-catalog.yml'))
 
@@ -136,7 +136,7 @@ class ConfigHandler(object):
             config += "Config location: " + str(StateHolder.catalog_config_file) + "\n"
             config += "Config:\n"
             config += "-------\n"
-            config += yaml.dump(StateHolder.config, default_flow_style=False, default_style='', indent=4)
+            config += yaml.safe_dump(StateHolder.config, default_flow_style=False, default_style='', indent=4)
         return config
 
     @staticmethod
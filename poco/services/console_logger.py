@@ -152,11 +152,11 @@ class ColorPrint:
 
     @staticmethod
     def exit_after_print_messages(message, doc=None, msg_type="error"):
-        if "error" is msg_type:
+        if msg_type == "error":
             ColorPrint.print_error(message)
-        elif "warn" is msg_type:
+        elif msg_type == "warn":
             ColorPrint.print_warning(message)
-        elif "info" is msg_type:
+        elif msg_type == "info":
             ColorPrint.print_info(message)
         else:
             print(message)
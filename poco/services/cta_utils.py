@@ -16,27 +16,32 @@ class CTAUtils:
     @staticmethod
     def get_cta():
         res = ""
-        if CTAUtils.one_of_local_files_exits(files=['poco.yml', 'poco.yaml']):
+        local_files = CTAUtils.get_local_files()
+        have_poco_file = CTAUtils.one_of_local_files_exits(files=['poco.yml', 'poco.yaml'], local_files=local_files)
+        have_other_file = CTAUtils.one_of_local_files_exits(
+            files=['docker-compose.yml', 'docker-compose.yaml', '.poco', 'docker'], local_files=local_files)
+        catalog_exists = CTAUtils.catalog_exists()
+        if have_poco_file:
             res = CTAUtils.CTA_STRINGS['have_all']
-        elif not CTAUtils.catalog_exists() and CTAUtils.one_of_local_files_exits(
-                files=['docker-compose.yml', 'docker-compose.yaml', '.poco', 'docker']) \
-                and not CTAUtils.one_of_local_files_exits(files=['poco.yml', 'poco.yaml']):
+        elif not catalog_exists and have_other_file:
             res = CTAUtils.CTA_STRINGS['have_file']
-        elif not CTAUtils.catalog_exists() and not CTAUtils.one_of_local_files_exits(
-                files=['docker-compose.yml', 'docker-compose.yaml', '.poco', 'docker']):
+        elif not catalog_exists and not have_other_file:
             res = CTAUtils.CTA_STRINGS['default']
-        elif CTAUtils.catalog_exists():
+        elif catalog_exists:
             res = CTAUtils.CTA_STRINGS['have_cat']
         return res
 
     @staticmethod
-    def one_of_local_files_exits(files):
-        actual_dir = os.getcwd()
+    def get_local_files():
+        """Read the actual directory once instead of checking the files one by one"""
+        return set(os.listdir(os.getcwd()))
+
+    @staticmethod
+    def one_of_local_files_exits(files, local_files=None):
+        if local_files is None:
+            local_files = CTAUtils.get_local_files()
         ''' TODO handle extension'''
-        for file in files:
-            if os.path.exists(os.path.join(actual_dir, file)):
-                return True
-        return False
+        return not local_files.isdisjoint(files)
 
     @staticmethod
     def catalog_exists():
@@ -0,0 +1,40 @@
+import sys
+from docopt import DocoptExit, Dict, Option, AnyOptions, TokenStream, printable_usage, parse_defaults, \
+    formal_usage, parse_pattern, parse_argv, extras
+
+
+class DocoptUtils:
+
+    MAX_PATTERNS = 64
+    patterns = dict()  # usage doc -> (printable usage, options, compiled pattern)
+
+    @staticmethod
+    def docopt(doc, argv=None, help=True, version=None, options_first=False):
+        """Same as docopt.docopt, but the usage grammar of a doc is parsed only once"""
+        if argv is None:
+            argv = sys.argv[1:]
+        usage, options, pattern = DocoptUtils.compile(doc)
+        DocoptExit.usage = usage
+        argv = parse_argv(TokenStream(argv, DocoptExit), list(options), options_first)
+        extras(help, version, argv, doc)
+        matched, left, collected = pattern.match(argv)
+        if matched and left == []:
+            # default list values belong to the cached pattern, give back copies
+            return Dict((a.name, list(a.value) if isinstance(a.value, list) else a.value)
+                        for a in (pattern.flat() + collected))
+        raise DocoptExit()
+
+    @staticmethod
+    def compile(doc):
+        """Parse usage and options of the doc and cache the fixed pattern"""
+        if doc not in DocoptUtils.patterns:
+            if len(DocoptUtils.patterns) >= DocoptUtils.MAX_PATTERNS:
+                DocoptUtils.patterns.clear()
+            usage = printable_usage(doc)
+            options = parse_defaults(doc)
+            pattern = parse_pattern(formal_usage(usage), options)
+            pattern_options = set(pattern.flat(Option))
+            for any_options in pattern.flat(AnyOptions):
+                any_options.children = list(set(parse_defaults(doc)) - pattern_options)
+            DocoptUtils.patterns[doc] = (usage, options, pattern.fix())
+        return DocoptUtils.patterns[doc]
@@ -1,4 +1,5 @@
 import os
+import platform
 import re
 import sys
 from subprocess import Popen, PIPE
@@ -7,6 +8,8 @@ from .console_logger import ColorPrint
 
 class EnvironmentUtils:
 
+    HOST_SYSTEM = platform.system()  # invariant for the process
+
     @staticmethod
     def get_variable(key, default=None):
         return os.environ.get(key, default)
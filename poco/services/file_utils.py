@@ -1,6 +1,7 @@
 import datetime
-import git
+import errno
 import os
+import shutil
 import yaml
 import stat
 from .console_logger import ColorPrint
@@ -9,6 +10,10 @@ from .state import StateHolder
 
 class FileUtils:
 
+    RESOURCES_DIR = os.path.join(os.path.dirname(__file__), 'resources')
+    POCO_TEMPLATE = os.path.join(RESOURCES_DIR, 'poco.yml')
+    COMPOSE_TEMPLATE = os.path.join(RESOURCES_DIR, 'docker-compose.yml')
+
     @staticmethod
     def make_empty_file(directory, file):
         file = os.path.join(directory, file)
@@ -26,11 +31,30 @@ class FileUtils:
         if not os.path.exists(file):
             with open(file, 'w') as stream:
                 content = dict()
-                stream.write(yaml.dump(data=content, default_flow_style=False))
+                stream.write(yaml.safe_dump(data=content, default_flow_style=False))
+
+    @staticmethod
+    def copy_template(template, target_file):
+        """Create the target file from the template, if it is not exists. Return True if it is created"""
+        try:
+            fd = os.open(target_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+        except OSError as exc:
+            if exc.errno == errno.EEXIST:
+                return False
+            raise
+        try:
+            with os.fdopen(fd, 'wb') as target, open(template, 'rb') as source:
+                shutil.copyfileobj(source, target)
+        except (IOError, OSError):
+            os.remove(target_file)  # an empty file would block the next try
+            raise
+        return True
 
     @staticmethod
     def get_directory_name():
-        return os.path.basename(os.getcwd())
+        if StateHolder.directory_name is None:
+            StateHolder.directory_name = os.path.basename(os.getcwd())
+        return StateHolder.directory_name
 
     @staticmethod
     def get_relative_path(base_path, target_path):
@@ -38,6 +62,7 @@ class FileUtils:
 
     @staticmethod
     def get_git_repo(base_dir):
+        import git
         if not os.path.isdir(base_dir):
             ColorPrint.exit_after_print_messages(message="Target directory is not a valid git repository: " + base_dir)
         try:
@@ -66,24 +91,39 @@ class FileUtils:
 
     @staticmethod
     def get_filtered_sorted_alter_from_base_dir(base_dir, actual_dir, target_directories=list(), filter_ends=list()):
-        file_list = list()
-        files_dict = FileUtils.get_files_dict_from_directory(base_dir, actual_dir,
-                                                             target_directories=target_directories,
-                                                             filter_ends=filter_ends)
-        for key in files_dict.keys():
-            for work_dir in files_dict[key]:
-                file_list.append(FileUtils.get_compose_file_relative_path(
-                    repo_dir=base_dir, working_directory=work_dir, file_name=key))
-        return file_list
+        return FileUtils.get_filtered_sorted_alter_from_base_dir_multi(base_dir, actual_dir,
+                                                                       target_directories=target_directories,
+                                                                       filter_ends_list=[filter_ends])[0]
+
+    @staticmethod
+    def get_filtered_sorted_alter_from_base_dir_multi(base_dir, actual_dir, target_directories, filter_ends_list):
+        """Get one file list for every filter, the target directories are walked only once"""
+        file_lists = list()
+        for files_dict in FileUtils.get_files_dicts_from_directory(base_dir, actual_dir,
+                                                                   target_directories=target_directories,
+                                                                   filter_ends_list=filter_ends_list):
+            file_list = list()
+            for key in files_dict.keys():
+                for work_dir in files_dict[key]:
+                    file_list.append(FileUtils.get_compose_file_relative_path(
+                        repo_dir=base_dir, working_directory=work_dir, file_name=key))
+            file_lists.append(file_list)
+        return file_lists
 
     @staticmethod
     def get_files_dict_from_directory(base_dir, actual_dir, target_directories, filter_ends):
-        files_dict = dict()
+        return FileUtils.get_files_dicts_from_directory(base_dir, actual_dir, target_directories=target_directories,
+                                                        filter_ends_list=[filter_ends])[0]
+
+    @staticmethod
+    def get_files_dicts_from_directory(base_dir, actual_dir, target_directories, filter_ends_list):
+        files_dicts = [dict() for _ in filter_ends_list]
         for directory in target_directories:
             for root, sub_folders, files in os.walk(os.path.join(base_dir, FileUtils.get_file_path(
                     repo_dir=base_dir, working_directory=actual_dir, file_name=directory))):
-                FileUtils.filter_and_add_to_dict(files_dict, filter_ends, root, files)
-        return files_dict
+                for files_dict, filter_ends in zip(files_dicts, filter_ends_list):
+                    FileUtils.filter_and_add_to_dict(files_dict, filter_ends, root, files)
+        return files_dicts
 
     @staticmethod
     def filter_and_add_to_dict(files_dict, filter_ends, root, files):
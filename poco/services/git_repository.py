@@ -19,7 +19,7 @@ class GitRepository(AbstractRepository):
             if url is None:
                 ColorPrint.exit_after_print_messages(message="GIT URL is empty")
             if git_ssh_identity_file is None:
-                git_ssh_identity_file = os.path.expanduser("~/.ssh/id_rsa")
+                git_ssh_identity_file = os.path.join(StateHolder.user_home, ".ssh", "id_rsa")
 
             with git.Git().custom_environment(GIT_SSH=git_ssh_identity_file):
                 if not os.path.exists(target_dir) or not os.listdir(target_dir):
@@ -117,35 +117,6 @@ class GitRepository(AbstractRepository):
             remote = self.repo.create_remote('master', self.repo.remotes.origin.url)
             remote.push(refspec='{}:{}'.format(self.repo.active_branch, 'master'))
 
-    @staticmethod
-    def is_same_host(old_url, url):
-        return GitRepository.clean_url(str(old_url)) == GitRepository.clean_url(str(url))
-
-    @staticmethod
-    def clean_url(url):
-        # remove leading protocol
-        url = url.lstrip("https://")
-        url = url.lstrip("ssh://")
-
-        # remove user info
-        idx = url.find("@")
-        if not idx == -1:
-            url = url[idx+1:]
-
-        # remove port
-        idx = url.find(":")
-        if not idx == -1:
-            idx2 = url.find("/", idx)
-            if not idx2 == -1:
-                url = url[:idx] + url[idx2:]
-
-        # remove scm part ( Atlassian stash compatibility )
-        idx = url.find("/scm")
-        if not idx == -1:
-            url = url[:idx] + url[idx+4:]
-
-        return url
-
 
 class Progress(git.remote.RemoteProgress):
 
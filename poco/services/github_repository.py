@@ -35,7 +35,7 @@ class GitHubRepository(AbstractRepository):
             lst[repo_name]['git'] = str(repo.clone_url)
 
         self.write_yaml_file(os.path.join(self.target_dir, 'poco-catalog.yml'),
-                             yaml.dump(data=lst, default_flow_style=False), create=True)
+                             yaml.safe_dump(data=lst, default_flow_style=False), create=True)
 
     def push(self):
         print("TODO")
@@ -33,7 +33,7 @@ class GitLabRepository(AbstractRepository):
                 lst[project_name]['ssh'] = ssh
 
         self.write_yaml_file(os.path.join(self.target_dir, 'poco-catalog.yml'),
-                             yaml.dump(data=lst, default_flow_style=False), create=True)
+                             yaml.safe_dump(data=lst, default_flow_style=False), create=True)
 
     def push(self):
         print("TODO")
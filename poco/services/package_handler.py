@@ -4,6 +4,7 @@ import tarfile
 from subprocess import check_output, check_call
 from .console_logger import ColorPrint
 from .environment_utils import EnvironmentUtils
+from .file_utils import FileUtils
 from .state import StateHolder
 from .yaml_utils import YamlUtils
 
@@ -32,8 +33,7 @@ class PackageHandler(object):
         with open(compose_file, 'w') as stream:
             stream.write(res.replace(str(self.working_directory), "."))
 
-        src_file = os.path.join(os.path.dirname(__file__), 'resources/poco.yml')
-        shutil.copyfile(src=src_file, dst=poco_file)
+        shutil.copyfile(src=FileUtils.POCO_TEMPLATE, dst=poco_file)
         self.run_save_cmd(images=images)
 
     def run_save_cmd(self, images):
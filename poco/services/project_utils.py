@@ -1,7 +1,5 @@
 import os
 from .file_repository import FileRepository
-from .git_repository import GitRepository
-from .svn_repository import SvnRepository
 from .file_utils import FileUtils
 from .state import StateHolder
 from .console_logger import *
@@ -12,18 +10,27 @@ class ProjectUtils:
     @staticmethod
     def get_project_repository(project_element):
         """Get and store repository handler for named project"""
-        repo_handler = FileRepository(target_dir=ProjectUtils.get_target_dir(project_element=project_element))
-        if not StateHolder.offline and 'git' in project_element:
-            branch = project_element.get('branch', 'master')
-            repo_handler = GitRepository(target_dir=ProjectUtils.get_target_dir(project_element=project_element),
-                                         url=project_element.get('git'), branch=branch,
-                                         git_ssh_identity_file=project_element.get('ssh'))
-        elif not StateHolder.offline and 'svn' in project_element:
-            repo_handler = SvnRepository(target_dir=ProjectUtils.get_target_dir(project_element=project_element),
-                                         url=project_element.get('svn'))
+        target_dir = ProjectUtils.get_target_dir(project_element=project_element)
+        repo_handler = StateHolder.project_repositories.get(target_dir)
+        if repo_handler is None:  # clone or update only once in a run
+            repo_handler = ProjectUtils.create_project_repository(project_element=project_element,
+                                                                  target_dir=target_dir)
+            StateHolder.project_repositories[target_dir] = repo_handler
         StateHolder.repositories[StateHolder.name] = repo_handler
         return repo_handler
 
+    @staticmethod
+    def create_project_repository(project_element, target_dir):
+        if not StateHolder.offline and 'git' in project_element:
+            from .git_repository import GitRepository
+            return GitRepository(target_dir=target_dir, url=project_element.get('git'),
+                                 branch=project_element.get('branch', 'master'),
+                                 git_ssh_identity_file=project_element.get('ssh'))
+        if not StateHolder.offline and 'svn' in project_element:
+            from .svn_repository import SvnRepository
+            return SvnRepository(target_dir=target_dir, url=project_element.get('svn'))
+        return FileRepository(target_dir=target_dir)
+
     @staticmethod
     def add_repository(target_dir):
 
@@ -70,6 +77,11 @@ class ProjectUtils:
     def get_target_dir(project_element):
         return os.path.join(StateHolder.work_dir, project_element.get('repository_dir', StateHolder.name))
 
+    @staticmethod
+    def get_plan_options(plan):
+        """Get the plan as dictionary, a plan given only with its service list has no options"""
+        return plan if isinstance(plan, dict) else dict()
+
     @staticmethod
     def get_list_value(value):
         """Get list format, doesn't matter the config use one or list plan"""
@@ -4,17 +4,21 @@ import os
 class StateHolder:
 
     # Globals
+    user_home = os.path.expanduser(path='~')
     home_dir = None
     catalog_config_file = None
     global_config_file = None
     repositories = dict()
+    project_repositories = dict()  # target directory -> project repository handler of the actual run
 
     # input arguments
     args = dict()
+    active_args = frozenset()  # names of the given (truthy) arguments
 
     # Working directory
-    base_work_dir = os.path.join(os.path.expanduser(path='~'), 'workspace')
+    base_work_dir = os.path.join(user_home, 'workspace')
     work_dir = None
+    directory_name = None  # name of the actual directory
 
     # Config section
     config_parsed = False
@@ -48,19 +52,18 @@ class StateHolder:
     catalog_repositories = dict()
     default_catalog_repository = None
 
+    @staticmethod
+    def set_args(args):
+        StateHolder.args = args
+        StateHolder.active_args = frozenset(key for key, value in args.items() if value)
+
     @staticmethod
     def has_args(*args):
-        for arg in args:
-            if not StateHolder.args.get(arg):
-                return False
-        return True
+        return StateHolder.active_args.issuperset(args)
 
     @staticmethod
     def has_least_one_arg(*args):
-        for arg in args:
-            if StateHolder.args.get(arg):
-                return True
-        return False
+        return not StateHolder.active_args.isdisjoint(args)
 
     @staticmethod
     def process_extra_args():
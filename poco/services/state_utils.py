@@ -21,13 +21,13 @@ class StateUtils:
 
         StateUtils.prepare_config()
         StateHolder.process_extra_args()
-        if prepareable is not "config":
+        if prepareable != "config":
             StateUtils.prepare_catalog(prepareable)
         if prepareable not in ["config", "catalog_read", "catalog"]:
             StateUtils.prepare_project_repo()
         if prepareable not in ["config", "catalog_read", "catalog", "project_repo"]:
             StateUtils.prepare_project_file()
-        if prepareable is "compose_handler":
+        if prepareable == "compose_handler":
             StateHolder.compose_handler = ComposeHandler(StateHolder.poco_file)
 
     @staticmethod
@@ -41,20 +41,21 @@ class StateUtils:
     def prepare_catalog(elem):
         if StateHolder.catalog_config_file is None:
             StateHolder.catalog_config_file = os.path.join(StateHolder.home_dir, 'config')
-        StateUtils.prepare_config_handler()
         if os.path.exists(StateHolder.catalog_config_file):
             ConfigHandler.read_catalogs()
-            if elem is not "catalog_read":
+            if elem != "catalog_read":
                 CatalogHandler.load()
 
     @staticmethod
     def prepare_project_repo():
         """Get project parameters form catalog, if it is exists"""
-        if StateHolder.name is None or StateHolder.catalogs is None:
+        name = StateHolder.name
+        catalogs = StateHolder.catalogs
+        if name is None or catalogs is None:
             return
-        for catalog in StateHolder.catalogs:
-            if StateHolder.name in StateHolder.catalogs[catalog]:
-                StateHolder.catalog_element = StateHolder.catalogs[catalog].get(StateHolder.name)
+        for catalog in catalogs.values():
+            if name in catalog:
+                StateHolder.catalog_element = catalog[name]
         if StateHolder.catalog_element is None:
             return
         StateHolder.work_dir = StateHolder.base_work_dir  # set back if exists
@@ -64,9 +65,10 @@ class StateUtils:
     def prepare_project_file():
         if StateHolder.repository is None:
             StateHolder.poco_file = FileUtils.get_backward_compatible_poco_file(directory=os.getcwd())
-            if not StateHolder.name == FileUtils.get_directory_name():  # need check for valid plan handling
+            directory_name = FileUtils.get_directory_name()
+            if not StateHolder.name == directory_name:  # need check for valid plan handling
                 StateHolder.plan = StateHolder.name
-                StateHolder.name = FileUtils.get_directory_name()
+                StateHolder.name = directory_name
         else:
             StateHolder.poco_file = ProjectUtils.get_compose_file(True)
 
@@ -0,0 +1,72 @@
+import hashlib
+import json
+import os
+from .environment_utils import EnvironmentUtils
+from .state import StateHolder
+
+
+class YamlCache:
+
+    cache_dir = None  # resolved on first use
+
+    @staticmethod
+    def load(file, parser, object_pairs_hook=dict):
+        """Get back the parsed content of the file from the JSON cache, parse and cache it if it is changed"""
+        stat = os.stat(file)
+        cache_file = YamlCache.get_cache_file(file, kind=object_pairs_hook.__name__)
+        try:
+            with open(cache_file) as stream:
+                cached = json.load(stream, object_pairs_hook=object_pairs_hook)
+            if cached['mtime'] == stat.st_mtime and cached['size'] == stat.st_size:
+                return cached['data']
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            pass
+        data = parser(file)
+        YamlCache.store(cache_file=cache_file, stat=stat, data=data)
+        return data
+
+    @staticmethod
+    def store(cache_file, stat, data):
+        if data is None:
+            return  # empty or not parsable file, let the next read report it
+        try:
+            content = json.dumps({'mtime': stat.st_mtime, 'size': stat.st_size, 'data': data})
+            if json.loads(content)['data'] != data:
+                return  # not representable in JSON, for example not string keys
+            cache_dir = YamlCache.get_cache_dir()
+            if not os.path.exists(cache_dir):
+                os.makedirs(cache_dir, 0o700)
+            YamlCache.write_private(cache_file=cache_file, content=content)
+        except (IOError, OSError, ValueError, TypeError):
+            pass  # the cache is optional
+
+    @staticmethod
+    def write_private(cache_file, content):
+        """Write the file readable only by the user (configs can hold tokens), replace it in one step"""
+        temp_file = cache_file + '.' + str(os.getpid()) + '.tmp'
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            with os.fdopen(fd, 'w') as stream:
+                stream.write(content)
+            if os.name == 'nt' and os.path.exists(cache_file):
+                os.remove(cache_file)  # rename does not overwrite on Windows
+            os.rename(temp_file, cache_file)
+        except (IOError, OSError):
+            os.remove(temp_file)
+            raise
+
+    @staticmethod
+    def get_cache_file(file, kind):
+        """Ordered and unordered reads are cached separately, plain dicts do not keep key order on old Pythons"""
+        key = hashlib.sha1((kind + ':' + os.path.abspath(file)).encode('utf-8')).hexdigest()
+        return os.path.join(YamlCache.get_cache_dir(), key + '.json')
+
+    @staticmethod
+    def get_cache_dir():
+        """Empty or relative XDG_CACHE_HOME must be ignored, see the XDG Base Directory Specification"""
+        if YamlCache.cache_dir is None:
+            cache_home = EnvironmentUtils.get_variable("XDG_CACHE_HOME", "")
+            if not os.path.isabs(cache_home):
+                cache_home = os.path.join(StateHolder.user_home, '.cache')
+            YamlCache.cache_dir = os.path.join(cache_home, 'poco')
+        return YamlCache.cache_dir
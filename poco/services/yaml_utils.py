@@ -1,14 +1,22 @@
 from .console_logger import ColorPrint
+from .yaml_cache import YamlCache
 from collections import OrderedDict
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml based, much faster
+except ImportError:
+    from yaml import SafeLoader
 
 
 class YamlUtils:
 
-    loader = yaml.Loader if not hasattr(yaml, 'FullLoader') else yaml.FullLoader
+    loader = SafeLoader
 
     @staticmethod
-    def read(file, doc=None, fault_tolerant=False):
+    def read(file, doc=None, fault_tolerant=False, cached=False):
+        if cached:
+            return YamlCache.load(file=file, parser=lambda f: YamlUtils.read(file=f, doc=doc,
+                                                                              fault_tolerant=fault_tolerant))
         with open(file) as stream:
             try:
                 return yaml.load(stream=stream, Loader=YamlUtils.loader)
@@ -20,16 +28,19 @@ class YamlUtils:
     @staticmethod
     def write(file, data):
         with open(file, 'w') as stream:
-            stream.write(yaml.dump(data=data, default_flow_style=False))
+            stream.write(yaml.safe_dump(data=data, default_flow_style=False))
 
     @staticmethod
     def dump(data):
-        ColorPrint.print_info(message=yaml.dump(
+        ColorPrint.print_info(message=yaml.safe_dump(
             data=data, default_flow_style=False, default_style='', indent=4), lvl=-1)
 
     @staticmethod
     def check_file(file, plan):
-        project_config = YamlUtils.read(file=file, fault_tolerant=True)
+        try:  # read as ComposeHandler does, so both share the cache entry
+            project_config = YamlUtils.read_ordered(file=file, cached=True)
+        except yaml.YAMLError:
+            return False
         if project_config is None:
             return False
         if 'plan' not in project_config:
@@ -38,9 +49,16 @@ class YamlUtils:
             return False
         return plan in project_config['plan']
 
+    @staticmethod
+    def read_ordered(file, cached=False):
+        if cached:
+            return YamlCache.load(file=file, parser=YamlUtils.read_ordered, object_pairs_hook=OrderedDict)
+        with open(file) as stream:
+            return YamlUtils.ordered_load(stream)
+
     @staticmethod
     def ordered_load(stream, object_pairs_hook=OrderedDict):
-        class OrderedLoader(yaml.SafeLoader):
+        class OrderedLoader(SafeLoader):
             pass
 
         def construct_mapping(loader, node):
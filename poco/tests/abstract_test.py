@@ -10,6 +10,7 @@ import poco.poco as poco
 from ..services.file_utils import FileUtils
 from ..services.state import StateHolder
 from ..services.console_logger import ColorPrint
+from ..services.yaml_cache import YamlCache
 try:
     from StringIO import StringIO
 except ImportError:
@@ -73,6 +74,7 @@ class AbstractTestSuite(unittest.TestCase):
 
         self.clean_states()
         StateHolder.base_work_dir = self.ws_dir
+        YamlCache.cache_dir = os.path.join(self.tmpdir, 'cache')
 
     def tearDown(self):
         os.chdir(self.orig_dir)
@@ -88,9 +90,11 @@ class AbstractTestSuite(unittest.TestCase):
         StateHolder.catalog_config_file = None
         StateHolder.global_config_file = None
         StateHolder.repositories = dict()
-        StateHolder.args = dict()
+        StateHolder.project_repositories = dict()
+        StateHolder.set_args(dict())
         StateHolder.base_work_dir = os.path.join(os.path.expanduser(path='~'), 'workspace')
         StateHolder.work_dir = None
+        StateHolder.directory_name = None
         StateHolder.config_parsed = False
         StateHolder.config = None
         StateHolder.catalogs = None
@@ -1,10 +1,22 @@
 import git
+try:
+    from unittest import mock
+except ImportError:
+    import mock
 import os
+import subprocess
+import sys
 import yaml
 import poco.poco as poco
 from .abstract_test import AbstractTestSuite
 from poco.services.file_utils import FileUtils
+from poco.services.command_handler import CommandHandler
+from poco.services.command_runners import ScriptPlanRunner, DockerPlanRunner
+from poco.services.compose_handler import ComposeHandler
 from poco.services.cta_utils import CTAUtils
+from poco.services.yaml_cache import YamlCache
+from poco.services.yaml_utils import YamlUtils
+from poco.services.state import StateHolder
 
 
 class PocoTestSuite(AbstractTestSuite):
@@ -136,6 +148,107 @@ class PocoTestSuite(AbstractTestSuite):
         self.assertIn(yaml.dump(AbstractTestSuite.LOCAL_CONFIG, default_flow_style=False, default_style='', indent=4)
                       .strip(), out_string)
 
+    def test_config_cache_with_modified_config(self):
+        self.init_with_remote_catalog()
+        with self.captured_output() as (out, err):
+            self.run_poco_command("repo", "ls")
+        self.assertIn("Mode: developer\nOffline: False\nAlways update: False", out.getvalue())
+        self.assertTrue(len(os.listdir(YamlCache.cache_dir)) > 0)
+        self.assertEqual(0, os.stat(YamlCache.cache_dir).st_mode & 0o077)
+        for cache_file in os.listdir(YamlCache.cache_dir):
+            self.assertEqual(0o600, os.stat(os.path.join(YamlCache.cache_dir, cache_file)).st_mode & 0o777)
+        self.init_poco_config({'mode': 'demo'})
+        with self.captured_output() as (out, err):
+            self.run_poco_command("repo", "ls")
+        self.assertIn("Mode: demo\nOffline: False\nAlways update: True", out.getvalue())
+
+    def test_poco_file_check_and_read_share_cache(self):
+        file = os.path.join(self.ws_dir, 'poco.yml')
+        with open(file, 'w') as stream:
+            stream.write("plan:\n  zeta: a.yml\n  alpha: b.yml\n")
+        self.assertTrue(YamlUtils.check_file(file, 'alpha'))
+        plans = YamlUtils.read_ordered(file=file, cached=True)['plan']
+        self.assertEqual(['zeta', 'alpha'], list(plans.keys()))
+        self.assertEqual(1, len(os.listdir(YamlCache.cache_dir)))
+
+    def test_kept_checkout_only_with_same_origin(self):
+        target_dir = os.path.join(self.ws_dir, 'checkout')
+        repo = git.Repo.init(target_dir)
+        repo.create_remote('origin', 'https://github.com/shiwaforce/poco-example.git')
+        StateHolder.always_update = False
+        self.assertTrue(ComposeHandler.is_kept_checkout(target_dir, 'https://github.com/shiwaforce/poco-example.git'))
+        self.assertFalse(ComposeHandler.is_kept_checkout(target_dir, 'https://github.com/shiwaforce/poco.git'))
+        StateHolder.always_update = True
+        self.assertFalse(ComposeHandler.is_kept_checkout(target_dir, 'https://github.com/shiwaforce/poco-example.git'))
+
+    def test_env_and_compose_files_from_one_walk(self):
+        directory = os.path.join(self.ws_dir, 'compose')
+        os.makedirs(directory)
+        for file in ('a.env', 'Dockerfile', 'x.yml', 'y.yaml'):
+            open(os.path.join(directory, file), 'w').close()
+        with mock.patch('os.walk', wraps=os.walk) as walk:
+            env_files, compose_files = FileUtils.get_filtered_sorted_alter_from_base_dir_multi(
+                base_dir=self.ws_dir, actual_dir=self.ws_dir, target_directories=['compose'],
+                filter_ends_list=[('.env',), ('.yml', '.yaml')])
+        self.assertEqual(1, walk.call_count)
+        self.assertEqual(['a.env'], [os.path.basename(file) for file in env_files])
+        self.assertEqual(['x.yml', 'y.yaml'], sorted(os.path.basename(file) for file in compose_files))
+
+    def test_script_command_array(self):
+        runner = ScriptPlanRunner(project_compose=dict(), working_directory=self.ws_dir)
+        self.assertEqual(['/bin/sh', '-c', 'echo a b'], runner.get_script_command_array("echo a b"))
+        self.assertEqual(['echo', 'a b'], runner.get_script_command_array(['echo', 'a b']))
+
+    def test_precompiled_hierarchy(self):
+        build_lib = os.path.join(self.tmpdir, 'build')
+        setup_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        subprocess.check_call([sys.executable, 'setup.py', '-q', 'build_py', '--build-lib', build_lib],
+                              cwd=setup_dir)
+        resources = os.path.join(build_lib, 'poco', 'services', 'resources')
+        hierarchy_file = os.path.join(resources, 'command-hierarchy.yml')
+        hierarchy_pickle = os.path.join(resources, 'command-hierarchy.pkl')
+        os.utime(hierarchy_pickle, (0, 0))  # installed files have no reliable mtime order
+        with mock.patch.object(CommandHandler, 'HIERARCHY_FILE', hierarchy_file), \
+                mock.patch.object(CommandHandler, 'HIERARCHY_PICKLE', hierarchy_pickle):
+            self.assertEqual(YamlUtils.read(hierarchy_file), CommandHandler.load_precompiled_hierarchy())
+            with open(hierarchy_file, 'a') as stream:
+                stream.write("\n")
+            self.assertIsNone(CommandHandler.load_precompiled_hierarchy())
+
+    def test_cache_dir_ignores_relative_xdg_cache_home(self):
+        for cache_home in ('', 'relative'):
+            YamlCache.cache_dir = None
+            with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': cache_home}):
+                self.assertEqual(os.path.join(StateHolder.user_home, '.cache', 'poco'), YamlCache.get_cache_dir())
+
+    def test_docker_files_scanned_per_compose_dir(self):
+        for directory in ('first', 'second'):
+            os.makedirs(os.path.join(self.ws_dir, directory))
+            open(os.path.join(self.ws_dir, directory, directory + '.yml'), 'w').close()
+        runner = DockerPlanRunner(project_compose=None, working_directory=self.ws_dir, repo_dir=self.ws_dir)
+        for directory in ('first', 'second'):
+            files = runner.get_docker_files(plan={'docker-compose-dir': directory})
+            self.assertEqual([directory + '.yml'], [os.path.basename(file) for file in files])
+
+    def test_copy_template_only_once(self):
+        target_file = os.path.join(self.ws_dir, 'poco.yml')
+        self.assertTrue(FileUtils.copy_template(FileUtils.POCO_TEMPLATE, target_file))
+        self.assertFalse(FileUtils.copy_template(FileUtils.COMPOSE_TEMPLATE, target_file))
+        with open(FileUtils.POCO_TEMPLATE) as template, open(target_file) as target:
+            self.assertEqual(template.read(), target.read())
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(0o666 & ~umask, os.stat(target_file).st_mode & 0o777)
+
+    def test_environment_file_read_and_modified(self):
+        env_file = os.path.join(self.ws_dir, 'test.env')
+        with open(env_file, 'w') as stream:
+            stream.write("# comment\n\nFIRST=1\nSECOND = a=b # comment\n")
+        self.assertEqual({'FIRST': '1', 'SECOND': 'a=b'}, CommandHandler.read_environment_file(env_file))
+        with open(env_file, 'w') as stream:
+            stream.write("FIRST=12\n")
+        self.assertEqual({'FIRST': '12'}, CommandHandler.read_environment_file(env_file))
+
     def test_catalog_without_catalog(self):
         with self.captured_output() as (out, err):
             with self.assertRaises(SystemExit) as context:
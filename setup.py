@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 import poco
+import hashlib
+import os
+import pickle
 import sys
 import platform
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
 from setuptools.command.test import test as TestCommand
 
 requires = ['pyyaml==3.13', 'pyaml==18.11.0', 'svn==0.3.46', 'gitpython==2.1.15', 'docopt==0.6.2',
@@ -31,6 +35,23 @@ class PyTestCommand(TestCommand):
         rcode = pytest.main(self.test_args)
         sys.exit(rcode)
 
+class BuildPyCommand(build_py):
+    """ Build command, that precompiles the command hierarchy to a pickle file beside the YAML
+    """
+    def run(self):
+        build_py.run(self)
+        try:
+            import yaml
+        except ImportError:
+            return  # the hierarchy will be parsed from YAML at runtime
+        resources = os.path.join(self.build_lib, 'poco', 'services', 'resources')
+        with open(os.path.join(resources, 'command-hierarchy.yml'), 'rb') as stream:
+            content = stream.read()
+        # the digest of the YAML is stored, install order and mtimes of the files are not reliable
+        precompiled = {'digest': hashlib.sha1(content).hexdigest(), 'hierarchy': yaml.safe_load(content)}
+        with open(os.path.join(resources, 'command-hierarchy.pkl'), 'wb') as stream:
+            pickle.dump(precompiled, stream, pickle.HIGHEST_PROTOCOL)
+
 setup_options = dict(
     name='poco',
     version=poco.__version__,
@@ -48,7 +69,7 @@ setup_options = dict(
     include_package_data=True,
     install_requires=requires,
     tests_require=test_requires,
-    cmdclass={'test': PyTestCommand},
+    cmdclass={'test': PyTestCommand, 'build_py': BuildPyCommand},
     entry_points={
       'console_scripts': ['poco=poco.poco:main'],
     },